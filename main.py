@@ -150,8 +150,6 @@ def knn(load_nn=True):
 	print "Loading data ..."
 	X_train, y_train = load_mnist(mode='train', path='data/')
 	X_test, y_test = load_mnist(mode='test', path='data/')
-	X_train /= 255.
-	X_test /= 255.
 
 	if load_nn:
 		print "Loading NN ..."
@@ -197,8 +195,6 @@ def knn_without_nn():
 	print "Loading data ..."
 	X_train, y_train = load_mnist(mode='train', path='data/')
 	X_test, y_test = load_mnist(mode='test', path='data/')
-	X_train /= 255.
-	X_test /= 255.
 
 	print_inline("Training PCA ... ")
 	with Stopwatch(verbose=True):
@@ -253,8 +249,6 @@ def nn(load_nn=True):
 	print "Loading data ..."
 	X_train, y_train = load_mnist(mode='train', path='data/')
 	X_test, y_test = load_mnist(mode='test', path='data/')
-	X_train /= 255.
-	X_test /= 255.
 	y_test = one_hot(y_test)
 
 	if load_nn:
@@ -306,8 +300,6 @@ def logreg(load_nn=True):
 	print "Loading data ..."
 	X_train, y_train = load_mnist(mode='train', path='data/')
 	X_test, y_test = load_mnist(mode='test', path='data/')
-	X_train /= 255.
-	X_test /= 255.
 	y_test = one_hot(y_test)
 
 	if load_nn:
@@ -369,8 +361,6 @@ def gp(load_nn=True):
 	print "Loading data ..."
 	X_train, y_train = load_mnist(mode='train', path='data/')
 	X_test, y_test = load_mnist(mode='test', path='data/')
-	X_train /= 255.
-	X_test /= 255.
 	y_test = one_hot(y_test)
 
 	if load_nn:
@@ -2,13 +2,6 @@ import numpy as np
 import scipy.ndimage.interpolation
 import scipy.ndimage.filters
 
-try:
-    import seaborn as sns
-    sns.set()
-    from matplotlib import pyplot as plt
-except ImportError:
-    pass
-
 from utils import RNG, plot_greyscale_image
 from utils.dataset import load_mnist
 
@@ -155,9 +148,13 @@ class RandomAugmentator(RandomTransformation):
 
 
 if __name__ == '__main__':
+    import seaborn as sns
+    sns.set()
+    from matplotlib import pyplot as plt
+
     X, y = load_mnist(mode='train', path='../data/')
 
-    # x = X[0]/255.
+    # x = X[0]
     # y = shift(x, (-3, 3))
     # y = RandomShift(x_shift=(-5, 5), y_shift=(-5, 5), random_seed=1337)(x)
     # y = rotate(x, 30.)
@@ -174,6 +171,6 @@ if __name__ == '__main__':
     aug.add('RandomGaussian', sigma=(0., 1.))
     aug.add('RandomShift', x_shift=(-2, 2), y_shift=(-2, 2))
 
-    for y in aug.transform(X[:3]/255., 3):
+    for y in aug.transform(X[:3], 3):
         plot_greyscale_image(y)
         plt.show()
\ No newline at end of file
@@ -124,7 +124,6 @@ class GPClassifier(BaseEstimator):
     >>> X = X[train]; X.shape
     (84, 784)
     >>> y = one_hot(y[train])
-    >>> X /= 255.
     >>> gp = GPClassifier(random_seed=1337, kernel_params=dict(sigma=1., gamma=1.))
     >>> pi = softmax(gp.fit(X, y).f_);
     >>> accuracy_score(y, one_hot_decision_function(pi))
@@ -305,7 +304,6 @@ if __name__ == '__main__':
 
     X, y = load_mnist('train', '../../data/')
     train, test = TrainTestSplitter(random_seed=1337, shuffle=True).split(y, train_ratio=0.0015, stratify=True)
-    X /= 255.
 
     gp = GPClassifier(max_iter=100,
                       tol=1e-6,
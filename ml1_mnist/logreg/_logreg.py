@@ -1,9 +1,110 @@
 import numpy as np
+from multiprocessing.pool import ThreadPool
 
 import env
 from base import BaseEstimator
 from nn import NNClassifier
-from nn.layers import FullyConnected, Activation
+from nn.layers import FullyConnected
+from _logreg_kernel import get_kernels
+
+
+_L2_CACHE_SIZE = 256 * 1024 # bytes, used to choose batch size if `n_batches` == 'auto'
+
+
+def _as_float(X, dtype, scale_uint8=False):
+    """
+    Cast (mini-batch of) data to `dtype`. If `scale_uint8`, np.uint8 data
+    is treated as raw pixel intensities and also scaled to 0.-1. range.
+    """
+    if scale_uint8 and X.dtype == np.uint8:
+        X = X.astype(dtype)
+        X /= np.asarray(255., dtype=dtype)
+        return X
+    return X.astype(dtype, copy=False)
+
+
+class _SoftmaxRegressionNN(NNClassifier):
+    """
+    NNClassifier consisting of single fully-connected layer
+    with fused softmax + cross-entropy loss. If numba is available,
+    mini-batch updates are done by JIT-compiled kernels, bypassing
+    generic layers.
+
+    If also `n_workers` > 1, groups of `n_workers` mini-batches are
+    processed concurrently by persistent pool of threads, gradients
+    of the group are averaged and result in a single optimizer step
+    (hence `n_workers` times fewer steps per epoch).
+
+    Data is cast to the weights' dtype mini-batch-wise (see `_as_float`),
+    so that large (e.g. memory-mapped np.uint8) data is never converted
+    as a whole.
+    """
+    def __init__(self, n_workers=1, scale_uint8=False, **params):
+        self.n_workers = n_workers
+        self.scale_uint8 = scale_uint8
+        self._kernels = None
+        self._pool = None
+        super(_SoftmaxRegressionNN, self).__init__(**params)
+
+    def _use_kernels(self):
+        return self._kernels is not None and len(self.layers) == 1 and self.loss == 'softmax_cross_entropy'
+
+    def _fit(self, X, y, X_val=None, y_val=None):
+        # kernels are compiled (once) here rather than at import
+        self._kernels = get_kernels(self.layers[0].dtype) if self.layers else None
+        if self._use_kernels() and 1 < self.n_workers < self.n_batches:
+            self._pool = ThreadPool(self.n_workers)
+        try:
+            super(_SoftmaxRegressionNN, self)._fit(X, y, X_val=X_val, y_val=y_val)
+        finally:
+            if self._pool is not None:
+                self._pool.close()
+                self._pool.join()
+                self._pool = None
+
+    def forward_pass(self, X_batch):
+        X_batch = _as_float(X_batch, self.layers[0].W.dtype, self.scale_uint8)
+        return super(_SoftmaxRegressionNN, self).forward_pass(X_batch)
+
+    def batch_iter(self):
+        batches = ((_as_float(X_batch, self.layers[0].W.dtype, self.scale_uint8), y_batch)
+                   for X_batch, y_batch in super(_SoftmaxRegressionNN, self).batch_iter())
+        if self._pool is None:
+            for X_batch, y_batch in batches:
+                yield X_batch, y_batch
+            return
+        # yield groups of batches, each group is processed in parallel
+        group = []
+        for batch in batches:
+            group.append(batch)
+            if len(group) == self.n_workers:
+                yield tuple(zip(*group))
+                group = []
+        if group:
+            yield tuple(zip(*group))
+
+    def _batch_gradient(self, batch):
+        X_batch, y_batch = batch
+        fc = self.layers[0]
+        X_batch = np.ascontiguousarray(X_batch, dtype=fc.W.dtype)
+        y_batch = np.ascontiguousarray(y_batch, dtype=fc.W.dtype)
+        fc_softmax_xent_fwd, fc_bwd = self._kernels
+        loss, grad = fc_softmax_xent_fwd(X_batch, fc.W, fc.b, y_batch)
+        dW, db = fc_bwd(X_batch, grad)
+        return loss, dW, db
+
+    def update(self, X_batch, y_batch):
+        if not self._use_kernels():
+            return super(_SoftmaxRegressionNN, self).update(X_batch, y_batch)
+        if self._pool is not None: # group of batches
+            losses, dWs, dbs = zip(*self._pool.map(self._batch_gradient, zip(X_batch, y_batch)))
+            loss, dW, db = np.mean(losses), np.mean(dWs, axis=0), np.mean(dbs, axis=0)
+        else:
+            loss, dW, db = self._batch_gradient((X_batch, y_batch))
+        fc = self.layers[0]
+        fc.dW = dW + fc.L2 * fc.W + fc.L1 * np.sign(fc.W)
+        fc.db = db
+        return loss
 
 
 class LogisticRegression(BaseEstimator):
@@ -13,8 +114,9 @@ class LogisticRegression(BaseEstimator):
     ----------
     L1, L2 : non-negative float
         Regularization parameters
-    n_batches : int
-        Number of batches.
+    n_batches : int or 'auto'
+        Number of batches. If 'auto', batch size is chosen so that
+        a batch of data fits in about half of L2 cache.
     optimizer : {'adam'}, optional
         Specifies which optimizer to use in the algorithm.
     optimizer_params : kwargs, optional
@@ -23,10 +125,23 @@ class LogisticRegression(BaseEstimator):
         Whether to shuffle the dataset.
     random_seed : int or None, optional
         Pseudo-random number generator seed used for random sampling.
+    dtype : str, optional
+        Floating-point type of weights and of data used for training.
+        Data is converted mini-batch-wise.
+    n_workers : int, optional
+        Number of threads computing gradients of mini-batches concurrently
+        (requires numba). Gradients of every `n_workers` mini-batches
+        are averaged into a single optimizer step, so the number of
+        optimizer steps per epoch is reduced `n_workers` times.
+    scale_uint8 : bool, optional
+        Whether np.uint8 data (in training, validation and prediction)
+        is treated as raw pixel intensities and scaled to 0.-1. range
+        mini-batch-wise, e.g. `data` of `utils.dataset.MNISTDataset`.
     """
     def __init__(self, L1=0.0, L2=0.0, n_batches=10,
                  optimizer='adam', optimizer_params={},
-                 shuffle=True, random_seed=None):
+                 shuffle=True, random_seed=None, dtype='float32', n_workers=1,
+                 scale_uint8=False):
         self.L1 = L1
         self.L2 = L2
         self.n_batches = n_batches
@@ -34,40 +149,55 @@ class LogisticRegression(BaseEstimator):
         self.optimizer_params = optimizer_params
         self.shuffle = shuffle
         self.random_seed = random_seed
+        self.dtype = dtype
+        self.n_workers = n_workers
+        self.scale_uint8 = scale_uint8
         self._nnet = None
         super(LogisticRegression, self).__init__(_y_required=True)
 
+    def _auto_n_batches(self, X):
+        batch_size = max(32, _L2_CACHE_SIZE // (X.shape[1] * np.dtype(self.dtype).itemsize * 2))
+        n_batches = max(1, X.shape[0] // batch_size)
+        if self.optimizer_params.get('verbose', False):
+            print "Using {0} batches of size {1}".format(n_batches, batch_size)
+        return n_batches
+
     def _fit(self, X, y, X_val=None, y_val=None):
+        # `X` and `X_val` are cast to `dtype` mini-batch-wise
+        y = np.asarray(y, dtype=self.dtype)
+        n_batches = self.n_batches
+        if n_batches == 'auto': # depends on data, hence recomputed on each fit
+            n_batches = self._auto_n_batches(X)
         if self._nnet is None:
-            self._nnet = NNClassifier(
+            self._nnet = _SoftmaxRegressionNN(
                 layers=[
-                    FullyConnected(y.shape[1], L1=self.L1, L2=self.L2),
-                    Activation('softmax')
+                    FullyConnected(y.shape[1], L1=self.L1, L2=self.L2, dtype=self.dtype)
                 ],
-                loss='categorical_crossentropy',
+                loss='softmax_cross_entropy',
                 metric='accuracy_score',
-                n_batches=self.n_batches,
+                n_batches=n_batches,
                 optimizer=self.optimizer,
                 optimizer_params=self.optimizer_params,
                 shuffle=self.shuffle,
-                random_seed=self.random_seed
+                random_seed=self.random_seed,
+                n_workers=self.n_workers,
+                scale_uint8=self.scale_uint8
             )
+        else:
+            self._nnet.n_batches = n_batches
+            self._nnet.scale_uint8 = self.scale_uint8
         self._nnet.fit(X, y, X_val=X_val, y_val=y_val)
 
     def _predict(self, X):
         return self._nnet.predict(X)
 
     def _serialize(self, params):
-        nn_params = self._nnet.get_params(deep=False)
-        nn_params = self._nnet._serialize(nn_params)
-        params['_nnet'] = nn_params
+        params['_nnet'] = self._nnet._serialize(self._nnet.get_params(deep=False))
         return params
 
     def _deserialize(self, params):
-        nn = NNClassifier()
-        nn_params = params['_nnet']
-        nn_params = nn._deserialize(nn_params)
-        nn.set_params(**nn_params)
+        nn = _SoftmaxRegressionNN()
+        nn.set_params(**nn._deserialize(params['_nnet']))
         self._nnet = nn
         self._called_fit = True
         return params
@@ -75,13 +205,14 @@ class LogisticRegression(BaseEstimator):
 
 if __name__ == '__main__':
     import env
-    from utils.dataset import load_mnist
+    from utils.dataset import MNISTDataset
     from utils import one_hot
     from utils.read_write import load_model
-    X, y = load_mnist(mode='train', path='../../data/')
-    X /= 255.
+    mnist = MNISTDataset(mode='train', path='../../data/')
+    X, y = mnist.data, mnist.target # raw np.uint8, scaled mini-batch-wise
     logreg = LogisticRegression(n_batches=100,
                                 random_seed=1337,
+                                scale_uint8=True,
                                 optimizer_params=dict(
                                     max_epochs=19,
                                     learning_rate=1e-4,
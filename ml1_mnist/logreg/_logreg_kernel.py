@@ -0,0 +1,96 @@
+"""
+JIT-compiled kernels for training single-layer softmax regression.
+
+With small mini-batches the generic NN layers spend most of the time
+in NumPy dispatch rather than in arithmetic, so the whole forward and
+backward pass are compiled with numba (if it is installed).
+"""
+import numpy as np
+
+
+def _fc_softmax_xent_fwd(X, W, b, Y):
+    """
+    Forward pass of fully-connected layer followed by
+    fused softmax + cross-entropy loss.
+
+    Returns
+    -------
+    loss : float
+        Mean cross-entropy loss.
+    grad : (n_samples, n_outputs) np.ndarray
+        Gradient of the (summed) loss w.r.t. logits, i.e. P - Y.
+    """
+    Z = np.dot(X, W)
+    n_samples, n_outputs = Z.shape
+    loss = 0.
+    for i in range(n_samples):
+        z_max = Z[i, 0] + b[0]
+        for j in range(n_outputs):
+            Z[i, j] += b[j]
+            if Z[i, j] > z_max:
+                z_max = Z[i, j]
+        s = 0.
+        for j in range(n_outputs):
+            s += np.exp(Z[i, j] - z_max)
+        lse = z_max + np.log(s)
+        for j in range(n_outputs):
+            loss += Y[i, j] * (lse - Z[i, j])
+            Z[i, j] = np.exp(Z[i, j] - lse) - Y[i, j]
+    return loss / n_samples, Z
+
+
+def _fc_bwd(X, grad):
+    """
+    Backward pass of fully-connected layer (without regularization).
+
+    Returns
+    -------
+    dW : (n_features, n_outputs) np.ndarray
+    db : (n_outputs,) np.ndarray
+    """
+    dW = np.dot(X.T, grad)
+    n_samples, n_outputs = grad.shape
+    db = np.zeros(n_outputs, dtype=grad.dtype)
+    for i in range(n_samples):
+        for j in range(n_outputs):
+            db[j] += grad[i, j]
+    return dW, db
+
+
+_kernels = None # (fc_softmax_xent_fwd, fc_bwd), compiled on first use
+_warmed_up_dtypes = set()
+
+
+def get_kernels(dtype):
+    """
+    Compile kernels with numba (if available) on first call and
+    warm them up for `dtype`, so that the first epoch is not penalized.
+    numba is imported lazily, since it slows down import considerably.
+
+    Returns
+    -------
+    kernels : (fc_softmax_xent_fwd, fc_bwd) or None
+        None if numba is not installed.
+    """
+    global _kernels
+    if _kernels is None:
+        try:
+            from numba import njit
+        except ImportError:
+            _kernels = False
+        else:
+            # GIL is released, so that kernels can run concurrently in threads.
+            # No on-disk cache: this module is imported under several names
+            # (e.g. `_logreg_kernel` by scripts), which numba's cache cannot handle
+            _kernels = (njit(fastmath=True, nogil=True)(_fc_softmax_xent_fwd),
+                        njit(fastmath=True, nogil=True)(_fc_bwd))
+    if not _kernels:
+        return None
+
+    dtype = np.dtype(dtype)
+    if dtype not in _warmed_up_dtypes:
+        fc_softmax_xent_fwd, fc_bwd = _kernels
+        X, W, b, Y = (np.zeros(shape, dtype=dtype) for shape in ((1, 1), (1, 1), 1, (1, 1)))
+        fc_bwd(X, fc_softmax_xent_fwd(X, W, b, Y)[1])
+        _warmed_up_dtypes.add(dtype)
+    return _kernels
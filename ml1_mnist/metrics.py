@@ -1,11 +1,5 @@
 # TODO: add validation routine (numpyify if needed + check equal lengths)
 import numpy as np
-try:
-    import seaborn as sns
-    sns.set()
-    from matplotlib import pyplot as plt
-except ImportError:
-    pass
 
 
 def get_metric(metric_name):
@@ -112,6 +106,50 @@ def log_loss(y_actual, y_predicted, eps=1e-15, normalize=True):
     return loss
 
 
+def softmax_cross_entropy(y_actual, z_predicted, normalize=True):
+    """Cross-entropy loss computed directly from unnormalized log-probabilities.
+
+    Fuses softmax and `log_loss`: log-probabilities are obtained
+    via log-sum-exp trick, so no probabilities are materialized
+    and no clipping is needed.
+
+    Parameters
+    ----------
+    y_actual : (n_samples, n_outputs) array-like
+        Ground truth (correct) labels.
+    z_predicted : (n_samples, n_outputs) array-like
+        Predicted logits, i.e. inputs of softmax.
+    normalize : bool, optional
+        If True, return the mean loss per sample.
+        Otherwise, return the sum of the per-sample losses.
+
+    Returns
+    -------
+    loss : float
+
+    Examples
+    --------
+    >>> y = [[0, 0, 1], [1, 0, 0]]
+    >>> z = np.log([[1, 2, 5], [1, 2, 5]])
+    >>> softmax_cross_entropy(y, z) # doctest: +ELLIPSIS
+    1.2747...
+    >>> softmax_cross_entropy(y, z + 1000.) # doctest: +ELLIPSIS
+    1.2747...
+    >>> log_loss(y, [[0.125, 0.25, 0.625], [0.125, 0.25, 0.625]]) # doctest: +ELLIPSIS
+    1.2747...
+    """
+    if not isinstance(y_actual, np.ndarray):
+        y_actual = np.asarray(y_actual)
+    if not isinstance(z_predicted, np.ndarray):
+        z_predicted = np.asarray(z_predicted)
+    z_max = np.amax(z_predicted, axis=1, keepdims=True)
+    lse = z_max + np.log(np.sum(np.exp(z_predicted - z_max), axis=1, keepdims=True))
+    loss = -np.sum(y_actual * (z_predicted - lse))
+    if normalize:
+        loss /= float(len(y_actual))
+    return loss
+
+
 def confusion_matrix(y_actual, y_predicted, labels=None, normalize=None):
     """Compute confusion matrix.
 
@@ -201,6 +239,10 @@ def confusion_matrix(y_actual, y_predicted, labels=None, normalize=None):
 
 
 def plot_confusion_matrix(C, labels=None, labels_fontsize=None, **heatmap_params):
+    import seaborn as sns
+    sns.set()
+    from matplotlib import pyplot as plt
+
     fig = plt.figure()
 
     # default params
@@ -73,6 +73,44 @@ class TrainTestSplitter(object):
         self.shuffle = shuffle
         self.random_seed = random_seed
         self.rng = RNG(self.random_seed)
+        self._group_cache = None # (`y`, groups) for the last grouped `y`
+
+    def _group_indices(self, y):
+        """
+        Group indices of samples by their labels.
+
+        Labels can be either scalars or rows (e.g. one-hot encoded).
+        Groups are cached for the last `y` (np.ndarray) seen, so that
+        repeated calls on the same labels (e.g. for each epoch or for
+        each parameters combination in CV) do not regroup them.
+        `y` is assumed not to be modified in-place meanwhile.
+
+        Returns
+        -------
+        groups : [np.ndarray]
+            Indices for each label (in increasing order),
+            labels are visited in sorted order.
+        """
+        if self._group_cache is not None:
+            y_cached, groups = self._group_cache
+            if y is y_cached and len(y) == sum(len(indices) for indices in groups):
+                return groups
+
+        y_ = np.asarray(y)
+        if y_.ndim == 1:
+            order = np.argsort(y_, kind='mergesort') # stable
+            y_sorted = y_[order]
+            is_boundary = y_sorted[1:] != y_sorted[:-1]
+        else:
+            y_ = y_.reshape(len(y_), -1)
+            order = np.lexsort(y_.T[::-1]) # stable, first column is the primary key
+            y_sorted = y_[order]
+            is_boundary = np.any(y_sorted[1:] != y_sorted[:-1], axis=1)
+        groups = np.split(order, np.flatnonzero(is_boundary) + 1)
+
+        if isinstance(y, np.ndarray):
+            self._group_cache = (y, groups)
+        return groups
 
     def split(self, y, train_ratio=0.8, stratify=False):
         """
@@ -103,17 +141,11 @@ class TrainTestSplitter(object):
             train_size = int(train_ratio * n)
             return np.split(indices, (train_size,))
 
-        # group indices by label
-        labels_indices = {}
-        for index, label in enumerate(y):
-            if not label in labels_indices: labels_indices[label] = []
-            labels_indices[label].append(index)
-
-        train, test = np.array([], dtype=np.int), np.array([], dtype=np.int)
-        for label, indices in sorted(labels_indices.items()):
-            size = int(train_ratio * len(indices))
-            train = np.concatenate((train, indices[:size]))
-            test  = np.concatenate(( test, indices[size:]))
+        # group indices by label and split each group
+        groups = self._group_indices(y)
+        sizes = [int(train_ratio * len(indices)) for indices in groups]
+        train = np.concatenate([indices[:size] for indices, size in zip(groups, sizes)])
+        test  = np.concatenate([indices[size:] for indices, size in zip(groups, sizes)])
 
         if self.shuffle:
             self.rng.shuffle(train)
@@ -150,22 +182,18 @@ class TrainTestSplitter(object):
                 yield fold
             return
 
-        # group indices
-        labels_indices = {}
-        for index, label in enumerate(y):
-            if isinstance(label, np.ndarray):
-                label = tuple(label.tolist())
-            if not label in labels_indices:
-                labels_indices[label] = []
-            labels_indices[label].append(index)
+        # group indices and split them label-wisely
+        groups = [np.array_split(indices, n_folds) for indices in self._group_indices(y)]
 
-        # split all indices label-wisely
-        for label, indices in sorted(labels_indices.items()):
-            labels_indices[label] = np.array_split(indices, n_folds)
+        # folds are stored contiguously in a single buffer
+        folds_sizes = [sum(len(indices[k]) for indices in groups) for k in xrange(n_folds)]
+        folds_bounds = np.cumsum([0] + folds_sizes)
+        folds_buffer = np.empty(folds_bounds[-1], dtype=np.int)
 
-        # collect respective splits into folds and shuffle if needed
+        # collect respective splits into folds (views) and shuffle if needed
         for k in xrange(n_folds):
-            fold = np.concatenate([indices[k] for _, indices in sorted(labels_indices.items())])
+            fold = folds_buffer[folds_bounds[k]:folds_bounds[k + 1]]
+            np.concatenate([indices[k] for indices in groups], out=fold)
             if self.shuffle:
                 self.rng.shuffle(fold)
             yield fold
@@ -193,8 +221,56 @@ class TrainTestSplitter(object):
             The testing set indices for current split.
         """
         folds = list(self.make_k_folds(y, n_folds=n_splits, stratify=stratify))
+        # concatenate once, then each fold is a contiguous window
+        indices = np.concatenate(folds)
+        offsets = np.cumsum([0] + [len(fold) for fold in folds])
         for i in xrange(n_splits):
-            yield np.concatenate(folds[:i] + folds[(i + 1):]), folds[i]
+            start, end = offsets[i], offsets[i + 1]
+            yield np.concatenate((indices[:start], indices[end:])), indices[start:end]
+
+    def k_fold_split_masks(self, y, n_splits=3, stratify=False):
+        """
+        Split data into train and test subsets for K-fold CV,
+        represented as boolean masks.
+
+        Unlike `k_fold_split`, no index arrays are concatenated:
+        fold of every sample is computed once, and masks
+        are obtained by a single comparison per split.
+
+        Parameters
+        ----------
+        y : (n_samples,) array-like
+            The target variable for supervised learning problems.
+            Stratification is done based upon the `y` labels.
+        n_splits : int, `n_splits` > 1, optional
+            Number of folds.
+        stratify : bool, optional
+            If True, the folds are made by preserving the percentage of samples
+            for each class. Stratification is done based upon the `y` labels.
+
+        Yields
+        ------
+        train_mask : (n_samples,) np.ndarray of bool
+            The training set mask for current split.
+        test_mask : (n_samples,) np.ndarray of bool
+            The testing set mask for current split.
+
+        Examples
+        --------
+        >>> y = np.array([1, 1, 2, 2, 3, 3, 3])
+        >>> tts = TrainTestSplitter(shuffle=False)
+        >>> for train_mask, test_mask in tts.k_fold_split_masks(y, n_splits=3):
+        ...     print y[train_mask], y[test_mask]
+        [2 3 3 3] [1 1 2]
+        [1 1 2 3 3] [2 3]
+        [1 1 2 2 3] [3 3]
+        """
+        fold_id = np.empty(len(y), dtype=np.min_scalar_type(n_splits))
+        for k, fold in enumerate(self.make_k_folds(y, n_folds=n_splits, stratify=stratify)):
+            fold_id[fold] = k
+        for k in xrange(n_splits):
+            test_mask = fold_id == k
+            yield ~test_mask, test_mask
 
 
 class GridSearchCV(object):
@@ -4,6 +4,7 @@ from copy import deepcopy
 import env
 from base import BaseEstimator
 from layers import FullyConnected, Activation, Dropout
+from activations import softmax
 from metrics import get_metric
 from optimizers import get_optimizer
 from utils import one_hot_decision_function
@@ -31,9 +32,7 @@ class NNClassifier(BaseEstimator):
         self.best_val_score_ = 0.
         self.n_layers_ = len(self.layers)
 
-        self._loss = get_metric(self.loss)
-        if self.loss == 'categorical_crossentropy':
-            self._loss_grad = lambda actual, predicted: -(actual - predicted)
+        self._setup_loss()
         self._metric = get_metric(self.metric)
         self._optimizer = get_optimizer(self.optimizer, **self.optimizer_params)
         self._tts = TrainTestSplitter(shuffle=self.shuffle, random_seed=self.random_seed)
@@ -42,6 +41,21 @@ class NNClassifier(BaseEstimator):
         self._training = False
         super(NNClassifier, self).__init__(_y_required=True) # TODO: split into multiple NNs later
 
+    def _setup_loss(self):
+        self._loss = get_metric(self.loss)
+        if self.loss == 'categorical_crossentropy':
+            self._loss_grad = lambda actual, predicted: -(actual - predicted)
+        if self.loss == 'softmax_cross_entropy':
+            # fused softmax + cross-entropy: gradient w.r.t. logits
+            # is simply P - Y, softmax Jacobian is never computed
+            self._loss_grad = lambda actual, predicted: softmax(predicted) - actual
+
+    def _output_proba(self, y_pred):
+        # with fused loss the last layer outputs logits
+        if self.loss == 'softmax_cross_entropy':
+            return softmax(y_pred)
+        return y_pred
+
     def _setup_layers(self, X_shape):
         for layer in self.layers:
             layer.setup_weights(X_shape) # allocate and initialize
@@ -90,6 +104,7 @@ class NNClassifier(BaseEstimator):
 
         if y.ndim == 1:
             y = y[:, np.newaxis]
+        self._setup_loss() # `loss` may have been changed via `set_params`
         if not self._initialized:
             self._setup_layers(X.shape)
         self._X_val = X_val
@@ -112,7 +127,7 @@ class NNClassifier(BaseEstimator):
             y_pred.append(self.forward_pass(X[end:]))
         return np.concatenate(y_pred)
 
-    def validate_proba(self, X=None): # can be called during training
+    def _validate_forward_pass(self, X=None): # can be called during training
         training_phase = self.is_training
         if training_phase:
             self.is_training = False
@@ -124,11 +139,18 @@ class NNClassifier(BaseEstimator):
             self.is_training = True
         return y_pred
 
+    def validate_loss(self, X, y):
+        return self._loss(y, self._validate_forward_pass(X))
+
+    def validate_proba(self, X=None):
+        return self._output_proba(self._validate_forward_pass(X))
+
     def validate(self, X=None):
-        y_pred = self.validate_proba(X)
+        # argmax is invariant to softmax, so it is applied to raw outputs
+        y_pred = self._validate_forward_pass(X)
         return one_hot_decision_function(y_pred)
 
-    def predict_proba(self, X):
+    def _predict_forward_pass(self, X):
         # predict on best layers but do not throw away current layers,
         # potentially, they can be improved during further training
         if self.best_layers_ is not None:
@@ -140,8 +162,11 @@ class NNClassifier(BaseEstimator):
             self.layers, self.best_layers_ = self.best_layers_, self.layers
         return y_pred
 
+    def predict_proba(self, X):
+        return self._output_proba(self._predict_forward_pass(X))
+
     def predict(self, X):
-        y_pred = self.predict_proba(X)
+        y_pred = self._predict_forward_pass(X)
         return one_hot_decision_function(y_pred)
 
     @property
@@ -194,9 +219,7 @@ class NNClassifier(BaseEstimator):
                     params[layers_attr][i] = Dropout(**layer_dict)
                 if layer_dict['layer'] == 'fully_connected':
                     fc = FullyConnected(**layer_dict)
-                    fc.W = np.asarray(layer_dict['W'])
-                    fc.b = np.asarray(layer_dict['b'])
-                    fc.dW = np.asarray(layer_dict['dW'])
-                    fc.db = np.asarray(layer_dict['db'])
+                    fc.W = np.asarray(layer_dict['W'], dtype=fc.dtype)
+                    fc.b = np.asarray(layer_dict['b'], dtype=fc.dtype)
                     params[layers_attr][i] = fc
         return params
\ No newline at end of file
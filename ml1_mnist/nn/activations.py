@@ -1,6 +1,12 @@
 import numpy as np
 
 
+# rows of at most this many elements are handled by the specialized
+# softmax kernel (e.g. 10 classes of MNIST)
+_SMALL_SOFTMAX_DIM = 16
+_softmax_small = None # compiled on first use, see `_get_softmax_small`
+
+
 def get_activation(activation_name):
     """
     Examples
@@ -92,9 +98,54 @@ def softmax(z, derivative=False):
     array([[ 0.109375,  0.1875  ,  0.234375]])
     """
     z = np.atleast_2d(z)
-    # avoid numerical overflow by removing max
-    e = np.exp(z - np.amax(z, axis=1, keepdims=True))
-    y = e / np.sum(e, axis=1, keepdims=True)
+    if z.ndim == 2 and z.shape[1] <= _SMALL_SOFTMAX_DIM and \
+            z.dtype in (np.float32, np.float64) and _get_softmax_small():
+        y = np.empty_like(z)
+        _softmax_small(z, y)
+    else:
+        # avoid numerical overflow by removing max
+        e = np.exp(z - np.amax(z, axis=1, keepdims=True))
+        y = e / np.sum(e, axis=1, keepdims=True)
     if derivative:
         return y * (1. - y) # element-wisely
     return y
+
+
+def _softmax_rows(z, out):
+    """Row-wise softmax of `z` written to `out`, one (short) row at a time."""
+    n_rows, n_cols = z.shape
+    for i in range(n_rows):
+        z_max = z[i, 0]
+        for j in range(1, n_cols):
+            if z[i, j] > z_max:
+                z_max = z[i, j]
+        s = 0.
+        for j in range(n_cols):
+            out[i, j] = np.exp(z[i, j] - z_max)
+            s += out[i, j]
+        for j in range(n_cols):
+            out[i, j] /= s
+
+
+def _get_softmax_small():
+    """
+    Compile `_softmax_rows` with numba (if available) on first call.
+    numba is imported lazily, since it slows down import considerably.
+
+    Returns
+    -------
+    kernel : callable or False
+        False if numba is not installed.
+    """
+    global _softmax_small
+    if _softmax_small is None:
+        try:
+            from numba import njit
+        except ImportError:
+            _softmax_small = False
+        else:
+            # no on-disk cache: this module is imported under several names;
+            # no fastmath and numpy error model, so that NaN/inf propagate
+            # as in NumPy (instead of e.g. raising ZeroDivisionError)
+            _softmax_small = njit(error_model='numpy')(_softmax_rows)
+    return _softmax_small
@@ -44,8 +44,13 @@ class FullyConnected(BaseLayer):
     (10,)
     >>> fc.n_params # size of W + size of b
     330
+    >>> fc = FullyConnected(10, dtype='float32')
+    >>> fc.setup_weights(x_shape=(128, 32))
+    >>> fc.W.dtype, fc.b.dtype
+    (dtype('float32'), dtype('float32'))
     """
-    def __init__(self, output_dim, bias=1.0, init='glorot_uniform', L1=0.0, L2=0.0, max_norm=-1, **params):
+    def __init__(self, output_dim, bias=1.0, init='glorot_uniform', L1=0.0, L2=0.0, max_norm=-1,
+                 dtype='float64', **params):
         self.output_dim = output_dim
         self.bias = bias
         self.init_name = init
@@ -53,6 +58,7 @@ class FullyConnected(BaseLayer):
         self.L1 = L1
         self.L2 = L2
         self.max_norm = max_norm
+        self.dtype = dtype
         self.W = np.array([]) # weights will be updated by optimizer
         self.b = np.array([])
         self.dW = np.array([]) # dW, db will be used by optimizer
@@ -67,11 +73,14 @@ class FullyConnected(BaseLayer):
 
     def setup_weights(self, x_shape):
         self.W = self.init(shape=(x_shape[1], self.output_dim), random_seed=self.random_seed)
-        self.b = np.full(self.W.shape[1], self.bias)
+        self.W = self.W.astype(self.dtype, copy=False)
+        self.b = np.full(self.W.shape[1], self.bias, dtype=self.dtype)
 
     def forward_pass(self, x):
         self._last_input = x
-        return np.dot(x, self.W) + self.b
+        z = np.dot(x, self.W)
+        z += self.b # in-place, no extra (n_samples, output_dim) temporary
+        return z
 
     def backward_pass(self, residual):
         self.dW = np.dot(self._last_input.T, residual) + self.L2 * self.W + self.L1 * np.sign(self.W)
@@ -95,10 +104,11 @@ class FullyConnected(BaseLayer):
             L1=self.L1,
             L2=self.L2,
             max_norm=self.max_norm,
+            dtype=np.dtype(self.dtype).name,
             W=self.W.tolist(),
             b=self.b.tolist(),
-            dW=self.dW.tolist(),
-            db=self.db.tolist(),
+            # dW, db are not stored: they are recomputed
+            # in the backward pass before every optimizer step
         )
 
 class Activation(BaseLayer):
@@ -66,7 +66,7 @@ class BaseOptimizer(object):
             if nnet._X_val is not None:
                 if self._early_stopping > 0 and self.epoch > 1:
                     self._early_stopping -= 1
-                val_loss = nnet._loss(nnet._y_val, nnet.validate_proba(nnet._X_val))
+                val_loss = nnet.validate_loss(nnet._X_val, nnet._y_val)
                 self.val_loss_history.append(val_loss)
                 val_score = nnet._metric(nnet._y_val, nnet.validate(nnet._X_val))
                 if self.epoch > 1 and val_score < 0.2 * self.val_score_history[-1]:
@@ -0,0 +1,59 @@
+import numpy as np
+from numpy.testing import assert_allclose
+from nose.plugins.skip import SkipTest
+
+from ml1_mnist.nn import activations
+from ml1_mnist.nn.activations import softmax
+
+
+def _softmax_numpy(z):
+    with np.errstate(invalid='ignore'):
+        e = np.exp(z - np.amax(z, axis=1, keepdims=True))
+        return e / np.sum(e, axis=1, keepdims=True)
+
+
+class TestSoftmax(object):
+    def __init__(self):
+        self.rng = np.random.RandomState(1337)
+
+    def test_small_kernel(self):
+        """Ensure specialized kernel for short rows agrees with NumPy."""
+        kernel = activations._get_softmax_small()
+        if not kernel:
+            raise SkipTest("numba is not installed")
+        for dtype, rtol in ((np.float32, 1e-5), (np.float64, 1e-12)):
+            z = (10. * self.rng.randn(100, 10)).astype(dtype)
+            y = np.empty_like(z)
+            kernel(z, y)
+            assert_allclose(y, _softmax_numpy(z), rtol=rtol)
+
+    def test_non_finite(self):
+        """Ensure NaN and inf propagate as in NumPy (e.g. diverged training)."""
+        kernel = activations._get_softmax_small()
+        if not kernel:
+            raise SkipTest("numba is not installed")
+        for dtype in (np.float32, np.float64):
+            z = np.array([[np.nan, 0., 0.],
+                          [0., np.nan, 0.],
+                          [np.inf, 0., 0.],
+                          [0., np.inf, 0.],
+                          [-np.inf, 0., 0.],
+                          [-np.inf, -np.inf, -np.inf],
+                          [1., 2., 3.]], dtype=dtype)
+            y = np.empty_like(z)
+            kernel(z, y)
+            assert_allclose(y, _softmax_numpy(z), rtol=1e-6)
+            assert_allclose(softmax(z), _softmax_numpy(z), rtol=1e-6)
+
+    def test_non_contiguous(self):
+        z = 10. * self.rng.randn(100, 20)
+        z = z[::2, ::2]
+        assert not z.flags.c_contiguous
+        assert_allclose(softmax(z), _softmax_numpy(z), rtol=1e-12)
+
+    def test_dtypes(self):
+        for dtype in (np.float16, np.float32, np.float64):
+            z = self.rng.randn(5, 10).astype(dtype)
+            y = softmax(z)
+            assert y.dtype == dtype
+            assert_allclose(y, _softmax_numpy(z), rtol=1e-2 if dtype == np.float16 else 1e-5)
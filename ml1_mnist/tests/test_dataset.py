@@ -0,0 +1,47 @@
+import os
+import shutil
+import struct
+import tempfile
+import numpy as np
+from numpy.testing import assert_allclose
+
+from ml1_mnist.utils.dataset import load_mnist, MNISTDataset
+
+
+class TestMNISTDataset(object):
+    def __init__(self):
+        rng = np.random.RandomState(1337)
+        self.images = rng.randint(0, 256, (7, 28, 28)).astype(np.uint8)
+        self.labels = rng.randint(0, 10, 7).astype(np.uint8)
+        self.path = tempfile.mkdtemp()
+        with open(os.path.join(self.path, 'train-images.idx3-ubyte'), 'wb') as f:
+            f.write(struct.pack('>IIII', 2051, 7, 28, 28))
+            f.write(self.images.tobytes())
+        with open(os.path.join(self.path, 'train-labels.idx1-ubyte'), 'wb') as f:
+            f.write(struct.pack('>II', 2049, 7))
+            f.write(self.labels.tobytes())
+
+    def teardown(self):
+        shutil.rmtree(self.path)
+
+    def test_raw(self):
+        mnist = MNISTDataset(mode='train', path=self.path)
+        assert len(mnist) == 7
+        assert mnist.data.dtype == np.uint8
+        np.testing.assert_array_equal(mnist.data, self.images.reshape(7, 784))
+        np.testing.assert_array_equal(mnist.target, self.labels)
+
+    def test_getitem(self):
+        mnist = MNISTDataset(mode='train', path=self.path)
+        X_expected = self.images.reshape(7, 784) / 255.
+        for index in (3, slice(2, 5), [6, 0, 2], np.array([1, 1])):
+            X, y = mnist[index]
+            assert X.dtype == np.float32
+            assert_allclose(X, X_expected[index], rtol=1e-6)
+            np.testing.assert_array_equal(y, self.labels[index])
+
+    def test_matches_load_mnist(self):
+        X, y = load_mnist(mode='train', path=self.path, cache=False)
+        X_mnist, y_mnist = MNISTDataset(mode='train', path=self.path)[:]
+        np.testing.assert_array_equal(X, X_mnist)
+        np.testing.assert_array_equal(y, y_mnist)
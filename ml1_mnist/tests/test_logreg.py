@@ -0,0 +1,53 @@
+import numpy as np
+from numpy.testing import assert_allclose
+from nose.plugins.skip import SkipTest
+
+from ml1_mnist.logreg import _logreg
+from ml1_mnist.logreg import LogisticRegression
+from ml1_mnist.utils import one_hot
+
+
+class TestLogisticRegression(object):
+    def __init__(self):
+        rng = np.random.RandomState(1337)
+        centers = rng.randn(10, 50) * 3.
+        y = rng.randint(0, 10, 300)
+        self.X = (centers[y] + rng.randn(300, 50)).astype(np.float32)
+        self.y = one_hot(y)
+
+    def _fit(self, X, **params):
+        logreg = LogisticRegression(n_batches=10, random_seed=1337,
+                                    optimizer_params=dict(max_epochs=3,
+                                                          learning_rate=1e-3,
+                                                          verbose=False,
+                                                          plot=False),
+                                    **params)
+        return logreg.fit(X, self.y)
+
+    def test_kernels(self):
+        """Ensure JIT-compiled kernels agree with generic NN layers."""
+        if _logreg.get_kernels('float32') is None:
+            raise SkipTest("numba is not installed")
+        for L1, L2 in ((0., 0.), (1e-3, 1e-2)):
+            fc = self._fit(self.X, L1=L1, L2=L2)._nnet.layers[0]
+            get_kernels = _logreg.get_kernels
+            _logreg.get_kernels = lambda dtype: None
+            try:
+                fc_generic = self._fit(self.X, L1=L1, L2=L2)._nnet.layers[0]
+            finally:
+                _logreg.get_kernels = get_kernels
+            assert_allclose(fc.W, fc_generic.W, atol=1e-6)
+            assert_allclose(fc.b, fc_generic.b, atol=1e-6)
+
+    def test_scale_uint8(self):
+        """Ensure raw np.uint8 data gives the same model as pre-scaled data."""
+        X_uint8 = np.clip(16. * self.X + 128., 0, 255).astype(np.uint8)
+        X_scaled = X_uint8.astype(np.float32) / np.float32(255.)
+        assert_allclose(_logreg._as_float(X_uint8, np.float32), X_uint8) # opt-in only
+        logreg_uint8 = self._fit(X_uint8, scale_uint8=True)
+        logreg_scaled = self._fit(X_scaled)
+        fc_uint8, fc_scaled = logreg_uint8._nnet.layers[0], logreg_scaled._nnet.layers[0]
+        assert_allclose(fc_uint8.W, fc_scaled.W, atol=1e-6)
+        assert_allclose(fc_uint8.b, fc_scaled.b, atol=1e-6)
+        np.testing.assert_array_equal(logreg_uint8.predict(X_uint8),
+                                      logreg_scaled.predict(X_scaled))
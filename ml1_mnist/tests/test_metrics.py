@@ -95,4 +95,22 @@ class TestLogLoss(object):
 
     def test_not_equal(self):
         assert_almost_equal(self.f([1.], [0.5]), -np.log(0.5))
-        assert_almost_equal(self.f([0., 1.], [0.5, 0.5]), -0.5 * np.log(0.5))
\ No newline at end of file
+        assert_almost_equal(self.f([0., 1.], [0.5, 0.5]), -0.5 * np.log(0.5))
+
+
+class TestSoftmaxCrossEntropy(object):
+    def __init__(self):
+        self.f = get_metric('softmax_cross_entropy')
+
+    def test_matches_log_loss(self):
+        y = np.eye(3)[[0, 2, 1, 2]]
+        z = np.array([[1., 2., 3.], [0., 0., 0.], [-1., 5., 2.], [4., 4., 1.]])
+        p = np.exp(z) / np.sum(np.exp(z), axis=1, keepdims=True)
+        assert_almost_equal(self.f(y, z), get_metric('log_loss')(y, p))
+        assert_almost_equal(self.f(y, z, normalize=False),
+                            get_metric('log_loss')(y, p, normalize=False))
+
+    def test_large_logits(self):
+        y = [[0., 1.], [1., 0.]]
+        z = np.array([[1000., 1000.], [-1000., 1000.]])
+        assert_almost_equal(self.f(y, z), 0.5 * (np.log(2.) + 2000.))
@@ -119,4 +119,34 @@ class TestSplit(object):
         for random_seed in np.random.randint(0, 1337, 100):
             tts = TTS(shuffle=True, random_seed=random_seed)
             for fold in tts.make_k_folds(self.y, n_folds=7, stratify=True):
-                np.testing.assert_allclose(np.sort(self.y[fold]), np.array([1, 2, 3]))
\ No newline at end of file
+                np.testing.assert_allclose(np.sort(self.y[fold]), np.array([1, 2, 3]))
+
+    def test_make_k_folds_stratification_one_hot(self):
+        """Ensure stratification is preserved for one-hot encoded labels."""
+        Y = np.eye(4)[self.y]
+        for random_seed in np.random.randint(0, 1337, 10):
+            tts = TTS(shuffle=True, random_seed=random_seed)
+            for fold in tts.make_k_folds(Y, n_folds=7, stratify=True):
+                np.testing.assert_allclose(np.sort(self.y[fold]), np.array([1, 2, 3]))
+
+    def test_k_fold_split_masks(self):
+        """Ensure masks select the same samples as `k_fold_split` indices."""
+        for random_seed in np.random.randint(0, 1337, 10):
+            for stratify in (False, True):
+                tts = TTS(shuffle=True, random_seed=random_seed)
+                for (train, test), (train_mask, test_mask) in \
+                        zip(list(tts.k_fold_split(self.y, n_splits=5, stratify=stratify)),
+                            list(tts.k_fold_split_masks(self.y, n_splits=5, stratify=stratify))):
+                    np.testing.assert_allclose(np.sort(train), np.flatnonzero(train_mask))
+                    np.testing.assert_allclose(np.sort(test), np.flatnonzero(test_mask))
+
+    def test_group_indices_cache(self):
+        """Ensure grouping is reused for the same `y` only."""
+        tts = TTS(shuffle=True, random_seed=1337)
+        groups = tts._group_indices(self.y)
+        assert tts._group_indices(self.y) is groups
+        y2 = self.y[::-1].copy()
+        groups2 = tts._group_indices(y2)
+        assert groups2 is not groups
+        for indices in groups2:
+            assert len(np.unique(y2[indices])) == 1
@@ -1,18 +1,19 @@
 import os.path
 import numpy as np
 
-try:
-    import seaborn as sns
-    # sns.set()
-    from matplotlib import pyplot as plt
-except ImportError:
-    pass
+# seaborn and matplotlib are imported lazily within functions below,
+# so that importing `utils` does not pay for their (slow) import
 
 
 def plot_greyscale_image(x, shape=(28, 28), title=None):
     """Render a given array of pixel data."""
+    from matplotlib import pyplot as plt
+    try:
+        import seaborn as sns
+    except ImportError:
+        sns = None
     image = np.asarray(x).reshape(shape)
-    if 'sns' in globals():
+    if sns is not None:
         fig = plt.figure(figsize=(6, 5))
         xticklabels = range(shape[1])
         xticklabels[::-2] = [''] * len(xticklabels[::-2])
@@ -32,6 +33,9 @@ def plot_greyscale_image(x, shape=(28, 28), title=None):
 
 
 def plot_learning_curves(l, a, vl, va, last_epochs=64, dirpath='.'):
+    import seaborn as sns
+    from matplotlib import pyplot as plt
+
     n_batches = len(l[0])
     n_epochs = len(l)
     x = np.linspace(1., n_epochs, n_epochs, endpoint=True)
@@ -98,6 +102,7 @@ def plot_learning_curves(l, a, vl, va, last_epochs=64, dirpath='.'):
 
 
 def plot_rbm_filters(W):
+    from matplotlib import pyplot as plt
     plt.figure(figsize=(12, 12))
     for i in xrange(64):
         filt = W[:, i].reshape((28, 28))
@@ -109,7 +114,8 @@ def plot_rbm_filters(W):
 
 
 if __name__ == '__main__':
+    from matplotlib import pyplot as plt
     from dataset import load_mnist
     X, y = load_mnist(mode='train', path='../../data/')
-    plot_greyscale_image(X[0]/255., title='Label is {0}'.format(y[0]))
+    plot_greyscale_image(X[0], title='Label is {0}'.format(y[0]))
     plt.show()
\ No newline at end of file
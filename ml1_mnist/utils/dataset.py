@@ -1,20 +1,10 @@
+import os
 import struct
-import os.path
+import tempfile
 import numpy as np
 
 
-def load_mnist(mode='train', path='.'):
-    """
-    Load and return MNIST dataset.
-
-    Returns
-    -------
-    data : (n_samples, 784) np.ndarray
-        Data representing raw pixel intensities (in 0.-255. range).
-    target : (n_samples,) np.ndarray
-        Labels vector.
-    """
-
+def _mnist_filenames(mode, path):
     if mode == 'train':
         fname_data = os.path.join(path, 'train-images.idx3-ubyte')
         fname_target = os.path.join(path, 'train-labels.idx1-ubyte')
@@ -23,14 +13,131 @@ def load_mnist(mode='train', path='.'):
         fname_target = os.path.join(path, 't10k-labels.idx1-ubyte')
     else:
         raise ValueError("`mode` must be 'test' or 'train'")
+    return fname_data, fname_target
+
+
+def _is_cache_valid(fname_cache, fname_source):
+    if not os.path.isfile(fname_cache):
+        return False
+    if not os.path.isfile(fname_source): # nothing to compare with
+        return True
+    return os.path.getmtime(fname_cache) >= os.path.getmtime(fname_source)
+
+
+def _save_atomic(fname, arr):
+    # write to temporary file in the same directory and rename it, so that
+    # concurrent readers never see partially written file
+    fd, fname_tmp = tempfile.mkstemp(suffix='.tmp', dir=os.path.dirname(fname) or '.')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            np.save(f, arr)
+        # `mkstemp` creates file readable only by owner, make it
+        # readable by others (e.g. for shared data directory) as usual
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(fname_tmp, 0o644 & ~umask)
+        os.rename(fname_tmp, fname)
+    except:
+        if os.path.exists(fname_tmp):
+            os.remove(fname_tmp)
+        raise
+
+
+def load_mnist(mode='train', path='.', cache=True):
+    """
+    Load and return MNIST dataset.
+
+    Parameters
+    ----------
+    mode : {'train', 'test'}, optional
+        Which part of the dataset to load.
+    path : str, optional
+        Directory containing IDX files.
+    cache : bool, optional
+        If True, after the first load, the parsed data is stored in `path`
+        as .npy files, which are memory-mapped (copy-on-write) afterwards.
+        The cache is rebuilt if IDX files are newer or it cannot be read,
+        and silently not written if `path` is not writable.
+
+    Returns
+    -------
+    data : (n_samples, 784) np.ndarray of np.float32
+        Data representing pixel intensities scaled to 0.-1. range.
+    target : (n_samples,) np.ndarray of np.uint8
+        Labels vector.
+    """
+
+    fname_data, fname_target = _mnist_filenames(mode, path)
+
+    fname_data_cache = os.path.join(path, '{0}_images.f32.npy'.format(mode))
+    fname_target_cache = os.path.join(path, '{0}_labels.npy'.format(mode))
+    if cache and _is_cache_valid(fname_data_cache, fname_data) and \
+            _is_cache_valid(fname_target_cache, fname_target):
+        try:
+            return np.load(fname_data_cache, mmap_mode='c'), np.load(fname_target_cache)
+        except (IOError, ValueError):
+            pass # unreadable or corrupt cache, parse IDX files instead
 
     with open(fname_data, 'rb') as fdata:
         magic, n_samples, n_rows, n_cols = struct.unpack(">IIII", fdata.read(16))
-        data = np.fromfile(fdata, dtype=np.uint8)
+        data = np.frombuffer(fdata.read(), dtype=np.uint8)
         data = data.reshape(n_samples, n_rows * n_cols)
 
     with open(fname_target, 'rb') as ftarget:
         magic, n_samples = struct.unpack(">II", ftarget.read(8))
-        target = np.fromfile(ftarget, dtype=np.int8)
+        target = np.frombuffer(ftarget.read(), dtype=np.uint8).copy() # writable
+
+    data = data.astype(np.float32)
+    data /= np.float32(255.)
+
+    if cache:
+        try:
+            _save_atomic(fname_data_cache, data)
+            _save_atomic(fname_target_cache, target)
+        except (IOError, OSError):
+            pass # e.g. read-only `path`, cache is just not used
+
+    return data, target
+
+
+class MNISTDataset(object):
+    """
+    MNIST dataset memory-mapped from IDX files.
+
+    Unlike `load_mnist`, pixel data is not loaded into memory at once:
+    only the requested samples are read, converted to np.float32
+    and scaled to 0.-1. range, e.g. `X, y = MNISTDataset()[:1000]`.
+
+    Parameters
+    ----------
+    mode : {'train', 'test'}, optional
+        Which part of the dataset to load.
+    path : str, optional
+        Directory containing IDX files.
+
+    Attributes
+    ----------
+    data : (n_samples, 784) np.memmap of np.uint8
+        Raw pixel intensities (in 0-255 range).
+    target : (n_samples,) np.ndarray of np.uint8
+        Labels vector.
+    """
+    def __init__(self, mode='train', path='.'):
+        fname_data, fname_target = _mnist_filenames(mode, path)
+
+        with open(fname_data, 'rb') as fdata:
+            magic, n_samples, n_rows, n_cols = struct.unpack(">IIII", fdata.read(16))
+        self.data = np.memmap(fname_data, dtype=np.uint8, mode='r',
+                              offset=16, shape=(n_samples, n_rows * n_cols))
+
+        with open(fname_target, 'rb') as ftarget:
+            magic, n_samples = struct.unpack(">II", ftarget.read(8))
+            self.target = np.frombuffer(ftarget.read(), dtype=np.uint8).copy() # writable
+
+    def __len__(self):
+        return len(self.target)
 
-    return data.astype(float), target
\ No newline at end of file
+    def __getitem__(self, index):
+        data = np.array(self.data[index], dtype=np.float32)
+        data /= np.float32(255.)
+        return data, self.target[index]
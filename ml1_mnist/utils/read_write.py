@@ -2,22 +2,32 @@ import json
 import importlib
 
 
+def _to_str(x):
+    return str(x) if isinstance(x, unicode) else x
+
+
+def _str_object_hook(d):
+    # get rid of ugly unicode in keys and string values of every
+    # decoded dict (lists of numbers are not traversed)
+    return {_to_str(key): _to_str(value) for key, value in d.items()}
+
+
 def save_model(model, filepath=None, params_mask={}, json_params={}):
     filepath = filepath or 'model.json'
     params = model.get_params(deep=False, **params_mask)
     params = model._serialize(params)
+    # compact separators by default
+    json_params_ = {'separators': (',', ':')}
+    json_params_.update(json_params)
+    # `json.dumps` (unlike `json.dump`) uses C encoder
     with open(filepath, 'w') as f:
-        json.dump(params, f, **json_params)
+        f.write(json.dumps(params, **json_params_))
 
 
 def load_model(filepath=None):
     filepath = filepath or 'model.json'
     with open(filepath) as f:
-        params = json.load(f)
-
-    # get rid of ugly unicode
-    to_str = lambda x: str(x) if isinstance(x, unicode) else x
-    params = dict(zip(params.keys(), map(to_str, params.values())))
+        params = json.load(f, object_hook=_str_object_hook)
 
     if not 'model' in params:
         raise ValueError("missed required field: 'model'")
@@ -33,4 +43,4 @@ def load_model(filepath=None):
         model.set_params(**params)
         return model
 
-    raise ValueError("cannot find model '{0}'".format(model_path))
\ No newline at end of file
+    raise ValueError("cannot find model '{0}'".format(model_path))